@@ -1,7 +1,27 @@
 import os
+import re
+import ast
 import json
+import hashlib
+import time
+import queue
+import atexit
+import io
+import gzip
+import shutil
+import html
+import string
+import ssl
 import smtplib
+import email.policy
 import logging
+import logging.handlers
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+from email.message import EmailMessage
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
@@ -11,15 +31,81 @@ from dotenv import load_dotenv
 script_dir = os.path.dirname(os.path.abspath(__file__))
 log_file_path = os.path.join(script_dir, "email_reminder.log")
 
+# Reminders pre-serialized by a previous run, reused while the tenants and
+# templates are unchanged
+GENERATED_SEND_PATH = os.path.join(script_dir, "_generated_send.py")
+
+# Read size used when compressing the log file for the log email
+LOG_ATTACHMENT_CHUNK_SIZE = 64 * 1024
+
+
+class BatchFileHandler(logging.FileHandler):
+    """
+    FileHandler that does not flush after every record. The records of a
+    batch collect in the file's write buffer and reach the disk when
+    BatchMemoryHandler flushes this handler once at the end of the batch.
+    """
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that flushes its target once after handing it the whole
+    buffer, instead of relying on the target to flush per record.
+    """
+
+    def flush(self):
+        self.acquire()
+        try:
+            super().flush()
+            if self.target:
+                self.target.flush()
+        finally:
+            self.release()
+
+
 # Configure Logging
-logging.basicConfig(
-    level=logging.INFO,  # Change to DEBUG for more detailed logs
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file_path, mode='a'),  # Append mode
-        logging.StreamHandler()                       # Logs to console
-    ]
-)
+log_format = '%(asctime)s - %(levelname)s - %(message)s'
+log_file_handler = BatchFileHandler(log_file_path, mode='a')  # Append mode
+log_file_handler.setFormatter(logging.Formatter(log_format))
+
+# Buffer records in memory and write them to the log file in batches; the
+# buffer is flushed when full, on errors, before the log email and at exit
+log_buffer_handler = BatchMemoryHandler(
+    capacity=10000, flushLevel=logging.ERROR, target=log_file_handler)
+
+log_console_handler = logging.StreamHandler()  # Logs to console
+log_console_handler.setFormatter(logging.Formatter(log_format))
+
+# Application threads only enqueue records; a background listener thread
+# does the actual file and console I/O
+log_queue = queue.Queue()
+log_listener = logging.handlers.QueueListener(
+    log_queue, log_buffer_handler, log_console_handler,
+    respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)  # Change to DEBUG for more detailed logs
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def flush_logs():
+    """
+    Waits for the listener thread to handle every queued record, then
+    writes the buffered records out to the log file.
+    """
+    log_queue.join()
+    log_buffer_handler.flush()
+
 
 logging.info("Script started.")
 
@@ -29,105 +115,462 @@ logging.info("Script started.")
 # Load environment variables from .env file if using locally (optional)
 load_dotenv()
 
-# Retrieve SMTP server details
-SMTP_SERVER = os.getenv("SMTP_SERVER")
-SMTP_PORT = os.getenv("SMTP_PORT")
-EMAIL_ADDRESS = os.getenv("EMAIL_ADDRESS")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
-LANDLORD_EMAIL = os.getenv("LANDLORD_EMAIL")
-
-# Validate SMTP details
-missing_smtp_vars = []
-for var_name, var_value in [
-    ("SMTP_SERVER", SMTP_SERVER),
-    ("SMTP_PORT", SMTP_PORT),
-    ("EMAIL_ADDRESS", EMAIL_ADDRESS),
-    ("EMAIL_PASSWORD", EMAIL_PASSWORD),
-    ("LANDLORD_EMAIL", LANDLORD_EMAIL)
-]:
-    if not var_value:
-        missing_smtp_vars.append(var_name)
-
-# This MUST NOT contain "***" anywhere
-if missing_smtp_vars:
-    logging.error(f"Missing SMTP environment variables: {
-                  ', '.join(missing_smtp_vars)}.")
-    exit(1)
-
-# Validate TENANTS environment variable
-TENANTS_ENV = os.getenv("TENANTS")
-if not TENANTS_ENV:
-    logging.error("TENANTS environment variable is missing.")
-    TENANTS = []
-else:
+REQUIRED_TENANT_FIELDS = ("email", "name",
+                          "payment_amount", "payment_description")
+
+
+class Tenant(NamedTuple):
+    """
+    A tenant entry from TENANTS, parsed and validated once at startup.
+    `error` holds the reason the entry cannot be emailed, if any, and
+    `to_header` the ready-parsed To: header for valid entries.
+    """
+    name: str
+    email: str
+    payment_amount: Optional[float]
+    payment_description: Optional[str]
+    property_location: str
+    error: Optional[str]
+    to_header: Optional[str] = None
+
+
+class Result(NamedTuple):
+    """
+    The outcome of sending one tenant's reminder.
+    """
+    success: bool
+    tenant_name: str
+    email: str
+    reason: Optional[str]
+
+
+@dataclass(frozen=True)
+class Config:
+    """
+    Settings read from the environment once per process.
+    """
+    smtp_server: str
+    smtp_port: int
+    email_address: str
+    email_password: str
+    landlord_email: str
+    max_workers: int
+    tenants: Tuple[Tenant, ...]
+
+
+def parse_address_header(header_name, addr):
+    """
+    Parses a single address into a ready-made header object under the SMTP
+    policy. Returns None for an address the parser rejects or that contains
+    a line break, which would fold into extra header lines.
+    """
+    if "\r" in addr or "\n" in addr:
+        return None
     try:
-        TENANTS = json.loads(TENANTS_ENV)
-        if not isinstance(TENANTS, list):
-            logging.error(
-                "TENANTS environment variable should be a JSON array of tenant objects.")
-            TENANTS = []
+        return email.policy.SMTP.header_factory(header_name, addr)
+    except Exception:
+        return None
+
+
+def parse_tenant(data):
+    """
+    Turns one raw TENANTS entry into a Tenant, casting payment_amount and
+    recording why the entry is unusable instead of raising.
+    """
+    if not isinstance(data, dict):
+        return Tenant("Unknown", "Unknown", None, None, "N/A",
+                      f"Tenant entry is not a JSON object: {data}")
+
+    name = str(data.get("name", "Unknown"))
+    addr = str(data.get("email", "Unknown"))
+    property_location = str(data.get("property_location", "N/A"))
+    missing_fields = [
+        field for field in REQUIRED_TENANT_FIELDS if field not in data]
+    if missing_fields:
+        return Tenant(name, addr, None, None, property_location,
+                      f"Missing fields: {', '.join(missing_fields)}")
+
+    # Ensure payment_amount is a float
+    try:
+        payment_amount = float(data["payment_amount"])
+    except (ValueError, TypeError):
+        return Tenant(name, addr, None, None, property_location,
+                      f"Invalid payment_amount: {data['payment_amount']}")
+
+    # Parse the To: header once instead of on every send. The address goes
+    # in as-is: formataddr() rejects non-ASCII addresses, which send_message()
+    # delivers over SMTPUTF8
+    to_header = parse_address_header("To", addr)
+    if to_header is None:
+        return Tenant(name, addr, None, None, property_location,
+                      f"Invalid email: {addr}")
+
+    return Tenant(name, addr, payment_amount,
+                  str(data["payment_description"]), property_location, None,
+                  to_header)
+
+
+def parse_tenants(tenants_env):
+    """
+    Parses the TENANTS JSON array into a tuple of Tenant records.
+    """
+    if not tenants_env:
+        logging.error("TENANTS environment variable is missing.")
+        return ()
+    try:
+        tenants = json.loads(tenants_env)
     except json.JSONDecodeError as e:
         logging.error(
             f"TENANTS environment variable contains invalid JSON: {e}")
-        TENANTS = []
+        return ()
+    if not isinstance(tenants, list):
+        logging.error(
+            "TENANTS environment variable should be a JSON array of tenant objects.")
+        return ()
+    return tuple(parse_tenant(tenant) for tenant in tenants)
+
+
+@lru_cache(maxsize=1)
+def get_config():
+    """
+    Reads and validates every environment setting the script needs. The
+    result is cached, so the environment (including the TENANTS JSON) is
+    only parsed once per process. Exits if the SMTP settings are unusable.
+    """
+    env = {var_name: os.getenv(var_name) for var_name in [
+        "SMTP_SERVER",
+        "SMTP_PORT",
+        "EMAIL_ADDRESS",
+        "EMAIL_PASSWORD",
+        "LANDLORD_EMAIL"
+    ]}
+
+    # Validate SMTP details
+    missing_smtp_vars = [
+        var_name for var_name, var_value in env.items() if not var_value]
+
+    # This MUST NOT contain "***" anywhere
+    if missing_smtp_vars:
+        logging.error(f"Missing SMTP environment variables: {
+                      ', '.join(missing_smtp_vars)}.")
+        exit(1)
+
+    # Convert SMTP_PORT to int
+    try:
+        smtp_port = int(env["SMTP_PORT"])
+    except ValueError:
+        logging.error(f"Invalid SMTP_PORT value: {env['SMTP_PORT']}")
+        exit(1)
+
+    # The sender address goes into the From: header of every email
+    if parse_address_header("From", env["EMAIL_ADDRESS"]) is None:
+        logging.error(f"Invalid EMAIL_ADDRESS value: {env['EMAIL_ADDRESS']}")
+        exit(1)
+
+    # Number of SMTP sessions sending tenant reminders in parallel
+    try:
+        max_workers = int(os.getenv("SMTP_MAX_WORKERS", "5"))
+        if max_workers < 1:
+            raise ValueError
+    except ValueError:
+        logging.error(
+            f"Invalid SMTP_MAX_WORKERS value: {os.getenv('SMTP_MAX_WORKERS')}")
+        exit(1)
+
+    return Config(
+        smtp_server=env["SMTP_SERVER"],
+        smtp_port=smtp_port,
+        email_address=env["EMAIL_ADDRESS"],
+        email_password=env["EMAIL_PASSWORD"],
+        landlord_email=env["LANDLORD_EMAIL"],
+        max_workers=max_workers,
+        tenants=parse_tenants(os.getenv("TENANTS")),
+    )
+
+
+CONFIG = get_config()
+TENANTS = CONFIG.tenants
 
 logging.info(f"Loaded TENANTS: {TENANTS}")
 
-# Convert SMTP_PORT to int
-try:
-    SMTP_PORT = int(SMTP_PORT)
-except ValueError:
-    logging.error(f"Invalid SMTP_PORT value: {SMTP_PORT}")
-    exit(1)
+# Partition tenants once, so the send path never re-validates an entry
+VALID_TENANTS = tuple(tenant for tenant in TENANTS if not tenant.error)
+INVALID_TENANTS = tuple(tenant for tenant in TENANTS if tenant.error)
+for tenant in INVALID_TENANTS:
+    logging.error(f"Invalid tenant data for {tenant.name}: {tenant.error}")
+
+
+def group_tenants(tenants):
+    """
+    Groups tenants whose reminders would be identical, i.e. that share the
+    name, amount, property and description substituted into the body, so
+    each group can be sent as one message. Keeps the original order.
+    """
+    groups = {}
+    for tenant in tenants:
+        key = (tenant.name, tenant.payment_amount,
+               tenant.property_location, tenant.payment_description)
+        groups.setdefault(key, []).append(tenant)
+    return tuple(tuple(group) for group in groups.values())
+
+
+REMINDER_GROUPS = group_tenants(VALID_TENANTS)
+
+# Line endings and leading dots that must be rewritten in SMTP message data
+LINE_ENDING_RE = re.compile(r"(?:\r\n|\n|\r(?!\n))")
+LEADING_DOT_RE = re.compile(br"(?m)^\.")
+
+
+class PipeliningMixin:
+    """
+    Mixin for smtplib clients that pipelines MAIL FROM, RCPT TO and DATA
+    (RFC 2920) when the server advertises PIPELINING, so the envelope of
+    each message costs a single round-trip instead of one per command.
+    Servers without the extension get smtplib's regular command-by-command
+    transaction.
+    """
 
-# Initialize counters
-success_count = 0
-failure_count = 0
-failed_tenants = []
+    # Session bookkeeping for ensure_session_healthy(), reset on connect
+    messages_sent = 0
+    last_success_ts = 0.0
+
+    def connect(self, host="localhost", port=0, source_address=None):
+        # smtplib only remembers the host for TLS hostname verification when
+        # it is passed to the constructor; sessions here connect later
+        self._host = host
+        return super().connect(host, port, source_address)
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(),
+                 rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if (not self.has_extn("pipelining")
+                or any(opt.lower() == "smtputf8" for opt in mail_options)):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options,
+                                    rcpt_options)
+
+        if isinstance(msg, str):
+            msg = LINE_ENDING_RE.sub("\r\n", msg).encode("ascii")
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+
+        esmtp_opts = list(mail_options)
+        if self.has_extn("size"):
+            esmtp_opts.insert(0, f"size={len(msg)}")
+        mail_args = "".join(f" {opt}" for opt in esmtp_opts)
+        rcpt_args = "".join(f" {opt}" for opt in rcpt_options)
+        commands = [f"mail FROM:{smtplib.quoteaddr(from_addr)}{mail_args}"]
+        commands += [f"rcpt TO:{smtplib.quoteaddr(addr)}{rcpt_args}"
+                     for addr in to_addrs]
+        commands.append("data")
+        if any("\r" in cmd or "\n" in cmd for cmd in commands):
+            raise ValueError("SMTP command contains a line break")
+
+        # Write the whole envelope at once, then read the replies in order
+        self.send("".join(f"{cmd}\r\n" for cmd in commands))
+        replies = [self.getreply() for _ in commands]
+        mail_code, mail_resp = replies[0]
+        data_code, data_resp = replies[-1]
+        senderrs = {
+            addr: reply for addr, reply in zip(to_addrs, replies[1:-1])
+            if reply[0] not in (250, 251)
+        }
+
+        if mail_code != 250 or len(senderrs) == len(to_addrs) \
+                or data_code != 354:
+            self._abort_pipelined_transaction(replies)
+            if mail_code != 250:
+                raise smtplib.SMTPSenderRefused(mail_code, mail_resp,
+                                                from_addr)
+            if len(senderrs) == len(to_addrs):
+                raise smtplib.SMTPRecipientsRefused(senderrs)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        data = LEADING_DOT_RE.sub(b"..", msg)
+        if not data.endswith(b"\r\n"):
+            data += b"\r\n"
+        self.send(data + b".\r\n")
+        code, resp = self.getreply()
+        if code != 250:
+            if code == 421:
+                self.close()
+            else:
+                self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return senderrs
+
+    def _abort_pipelined_transaction(self, replies):
+        """
+        Leaves the session in a clean state after a rejected pipelined
+        envelope. A session the server is closing, or one stuck waiting for
+        message data, cannot be reset and is closed instead.
+        """
+        codes = [code for code, _ in replies]
+        if 421 in codes or codes[-1] == 354:
+            self.close()
+        else:
+            self._rset()
 
 
-def send_email_reminder(tenant):
+class PipeliningSMTP(PipeliningMixin, smtplib.SMTP):
     """
-    Sends a rent payment reminder email to a single tenant.
+    Pipelining SMTP session that is upgraded to TLS with STARTTLS.
     """
-    global success_count, failure_count, failed_tenants
+
+
+class PipeliningSMTP_SSL(PipeliningMixin, smtplib.SMTP_SSL):
+    """
+    Pipelining SMTP session over implicit TLS (port 465), which saves the
+    EHLO/STARTTLS/EHLO round-trips before login.
+    """
+
+
+# TLS context shared by every (re)connect, so system CA certificates are only
+# loaded once, and a fixed EHLO name so connecting skips socket.getfqdn()
+TLS_CONTEXT = ssl.create_default_context()
+SMTP_LOCAL_HOSTNAME = "reminder-bot"
+
+# Port on which SMTP_PORT means implicit TLS instead of STARTTLS
+SMTP_SSL_PORT = 465
+
+# Socket timeout in seconds for every SMTP session, so a server that stops
+# answering fails that tenant instead of blocking a worker indefinitely
+SMTP_TIMEOUT = 30
+
+# Reused SMTP sessions are probed with a NOOP after this many idle seconds,
+# and replaced after carrying this many messages
+SMTP_IDLE_CHECK_SECONDS = 60
+SMTP_NOOP_TIMEOUT = 5
+SMTP_MAX_MESSAGES_PER_SESSION = 5000
+
+# Sending stops once this many reminders failed, or a third of the batch if
+# that is more
+ABORT_MIN_FAILURES = 10
+ABORT_FAILURE_FRACTION = 3
+
+# One SMTP session per worker thread, tracked so they can all be closed
+thread_sessions = threading.local()
+open_sessions = []
+open_sessions_lock = threading.Lock()
+
+
+def connect_smtp(server=None):
+    """
+    Connects and authenticates an SMTP session that can be reused for many
+    emails. Port 465 uses implicit TLS, any other port STARTTLS. Passing an
+    existing session reconnects it in place.
+    """
+    if server is None:
+        if CONFIG.smtp_port == SMTP_SSL_PORT:
+            server = PipeliningSMTP_SSL(local_hostname=SMTP_LOCAL_HOSTNAME,
+                                        timeout=SMTP_TIMEOUT,
+                                        context=TLS_CONTEXT)
+        else:
+            server = PipeliningSMTP(local_hostname=SMTP_LOCAL_HOSTNAME,
+                                    timeout=SMTP_TIMEOUT)
+    server.close()
     try:
-        # Validate required tenant fields
-        required_fields = ["email", "name",
-                           "payment_amount", "payment_description"]
-        missing_fields = [
-            field for field in required_fields if field not in tenant]
-        if missing_fields:
-            logging.error(f"Missing fields {
-                          missing_fields} in tenant data: {tenant}")
-            failure_count += 1
-            failed_tenants.append({
-                "tenant": tenant.get("name", "Unknown"),
-                "email": tenant.get("email", "Unknown"),
-                "reason": f"Missing fields: {', '.join(missing_fields)}"
-            })
-            return
-
-        # Ensure payment_amount is a float
+        server.connect(CONFIG.smtp_server, CONFIG.smtp_port)
+        server.ehlo()
+        if not isinstance(server, smtplib.SMTP_SSL):
+            server.starttls(context=TLS_CONTEXT)
+        server.login(CONFIG.email_address, CONFIG.email_password)
+    except Exception:
+        server.close()
+        raise
+    server.messages_sent = 0
+    server.last_success_ts = time.monotonic()
+    return server
+
+
+def ensure_session_healthy(server):
+    """
+    Checks a reused session before sending on it. A session that has
+    carried SMTP_MAX_MESSAGES_PER_SESSION messages is replaced, and one that
+    has been idle for more than SMTP_IDLE_CHECK_SECONDS is probed with a
+    NOOP under a short timeout, so a stale connection costs one round-trip
+    instead of a full socket timeout on the real send.
+    """
+    if server.messages_sent >= SMTP_MAX_MESSAGES_PER_SESSION:
+        logging.info(f"SMTP session sent {server.messages_sent} messages, "
+                     "reconnecting.")
         try:
-            payment_amount = float(tenant['payment_amount'])
-        except (ValueError, TypeError):
-            logging.error(
-                f"Invalid payment_amount for tenant {tenant.get('name', 'Unknown')}: {
-                    tenant.get('payment_amount')}"
-            )
-            failure_count += 1
-            failed_tenants.append({
-                "tenant": tenant.get("name", "Unknown"),
-                "email": tenant.get("email", "Unknown"),
-                "reason": f"Invalid payment_amount: {tenant.get('payment_amount')}"
-            })
-            return
-
-        subject = "Rent Payment Reminder"
-
-        # HTML email body
-        body = f"""\
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        connect_smtp(server)
+        return
+
+    if time.monotonic() - server.last_success_ts <= SMTP_IDLE_CHECK_SECONDS:
+        return
+    try:
+        previous_timeout = server.sock.gettimeout()
+        server.sock.settimeout(SMTP_NOOP_TIMEOUT)
+        code, _ = server.noop()
+        server.sock.settimeout(previous_timeout)
+    except (smtplib.SMTPException, OSError, AttributeError):
+        code = None
+    if code == 250:
+        server.last_success_ts = time.monotonic()
+    else:
+        logging.warning("Idle SMTP session failed its NOOP check, reconnecting.")
+        connect_smtp(server)
+
+
+def get_thread_session():
+    """
+    Returns the SMTP session owned by the current thread, connecting it on
+    first use.
+    """
+    server = getattr(thread_sessions, "server", None)
+    if server is None:
+        server = connect_smtp()
+        thread_sessions.server = server
+        with open_sessions_lock:
+            open_sessions.append(server)
+    return server
+
+
+def close_all_sessions():
+    """
+    Closes every SMTP session opened by get_thread_session().
+    """
+    with open_sessions_lock:
+        sessions = list(open_sessions)
+        open_sessions.clear()
+    for server in sessions:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+def send_with_reconnect(server, to_addrs, msg):
+    """
+    Sends a message over the shared session, reconnecting and retrying once
+    if the server dropped the connection. Returns the recipients the server
+    refused, if it accepted the others.
+    """
+    def send():
+        # Pre-serialized messages go straight to sendmail
+        if isinstance(msg, bytes):
+            return server.sendmail(CONFIG.email_address, to_addrs, msg)
+        return server.send_message(msg, CONFIG.email_address, to_addrs)
+
+    ensure_session_healthy(server)
+    try:
+        refused = send()
+    except smtplib.SMTPServerDisconnected as disconnect_err:
+        logging.warning(
+            f"SMTP connection lost ({disconnect_err}), reconnecting.")
+        connect_smtp(server)
+        refused = send()
+    server.messages_sent += 1
+    server.last_success_ts = time.monotonic()
+    return refused
+
+
+# HTML reminder body, compiled once; only the tenant fields are substituted
+BODY_TEMPLATE = string.Template("""\
         <html>
         <head>
             <style>
@@ -135,15 +578,15 @@ def send_email_reminder(tenant):
             </style>
         </head>
         <body>
-            <p>Dear {tenant['name']},</p>
+            <p>Dear $name,</p>
             <p>
-                This is a friendly reminder that your rent payment of <strong>${payment_amount:.2f}</strong> is due soon.
+                This is a friendly reminder that your rent payment of <strong>$$$amount</strong> is due soon.
             </p>
             <p>
                 <strong>Payment Details:</strong><br>
-                Property: {tenant.get('property_location', 'N/A')}<br>
-                Description: {tenant['payment_description']}<br>
-                Amount: <strong>${payment_amount:.2f}</strong>
+                Property: $property<br>
+                Description: $description<br>
+                Amount: <strong>$$$amount</strong>
             </p>
             <p>
                 If payment is not received by the 5th day of the month, a 10% late fee will be imposed.
@@ -172,49 +615,255 @@ def send_email_reminder(tenant):
             <p>Thank you!<br><br>Have a great day!</p>
         </body>
         </html>
-        """
+        """)
+
+# Plain-text alternative for mail clients that do not render HTML
+TEXT_TEMPLATE = string.Template("""\
+Dear $name,
+
+This is a friendly reminder that your rent payment of $$$amount is due soon.
+
+Payment Details:
+Property: $property
+Description: $description
+Amount: $$$amount
+
+If payment is not received by the 5th day of the month, a 10% late fee will be imposed.
+
+Pay Now: https://app.payrent.com/sign-in
+
+If you have any questions or need more information, please visit:
+https://segundorentalservices.net/
+
+Thank you!
+
+Have a great day!
+""")
+
+
+@lru_cache(maxsize=None)
+def render_reminder_body(tenant):
+    """
+    Renders the HTML reminder body for a tenant, escaping every tenant field
+    before it is inserted into the markup. Cached per tenant, so a retried
+    send does not escape and render the body again.
+    """
+    return BODY_TEMPLATE.substitute(
+        name=html.escape(tenant.name, quote=True),
+        amount=f"{tenant.payment_amount:.2f}",
+        property=html.escape(tenant.property_location, quote=True),
+        description=html.escape(tenant.payment_description, quote=True),
+    )
+
+
+@lru_cache(maxsize=None)
+def render_reminder_text(tenant):
+    """
+    Renders the plain-text fallback of the reminder for a tenant.
+    """
+    return TEXT_TEMPLATE.substitute(
+        name=tenant.name,
+        amount=f"{tenant.payment_amount:.2f}",
+        property=tenant.property_location,
+        description=tenant.payment_description,
+    )
+
+
+def build_reminder_headers():
+    """
+    Parses the headers every reminder shares (everything except To:) once,
+    so each message can take the parsed header objects as they are.
+    """
+    msg = EmailMessage(policy=email.policy.SMTP)
+    msg["Subject"] = "Rent Payment Reminder"
+    msg["From"] = CONFIG.email_address
+    return tuple(msg.raw_items())
 
-        # Create email
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = EMAIL_ADDRESS
-        msg["To"] = tenant["email"]
 
-        # Attach the HTML content
-        msg.attach(MIMEText(body, "html"))
+# Reminder headers, parsed once for every tenant
+REMINDER_HEADERS = build_reminder_headers()
+UNDISCLOSED_RECIPIENTS_HEADER = email.policy.SMTP.header_factory(
+    "To", "undisclosed-recipients:;")
 
-        # Send the email
+
+def build_reminder_message(group):
+    """
+    Builds the reminder for a group of tenants from the shared headers, with
+    a plain-text part and the HTML body as its preferred alternative.
+    """
+    tenant = group[0]
+    msg = EmailMessage(policy=email.policy.SMTP)
+    for header_name, header_value in REMINDER_HEADERS:
+        msg.set_raw(header_name, header_value)
+    if len(group) == 1:
+        msg.set_raw("To", tenant.to_header)
+    else:
+        msg.set_raw("To", UNDISCLOSED_RECIPIENTS_HEADER)
+    msg.set_content(render_reminder_text(tenant))
+    msg.add_alternative(render_reminder_body(tenant), subtype="html")
+    return msg
+
+
+def reminder_cache_key():
+    """
+    Hashes everything that goes into the reminders: the parsed tenants, the
+    shared headers, both body templates and this script's own source, which
+    covers how the messages are built. Pre-serialized reminders are only
+    reused while this key is unchanged.
+    """
+    digest = hashlib.sha256()
+    with open(os.path.abspath(__file__), "rb") as script_file:
+        digest.update(script_file.read())
+        digest.update(b"\0")
+    for part in (repr(REMINDER_GROUPS), repr(REMINDER_HEADERS),
+                 BODY_TEMPLATE.template, TEXT_TEMPLATE.template):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_generated_payloads(cache_key):
+    """
+    Loads the reminders pre-serialized by write_generated_payloads() on a
+    previous run, keyed by tenant group. The file holds a single literal,
+    read with ast.literal_eval() so nothing in it is ever executed. Returns
+    an empty dict if the file is missing, unreadable, or was generated for
+    different reminders.
+    """
+    try:
+        with open(GENERATED_SEND_PATH, encoding="utf-8") as generated_file:
+            generated = ast.literal_eval(generated_file.read())
+        cached_key = generated["cache_key"]
+        payloads = tuple(generated["payloads"])
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable {GENERATED_SEND_PATH}: {e}")
+        return {}
+
+    if cached_key != cache_key or len(payloads) != len(REMINDER_GROUPS):
+        return {}
+    logging.info(f"Using pre-serialized reminders from {GENERATED_SEND_PATH}.")
+    return {group: payload for group, payload in zip(REMINDER_GROUPS, payloads)
+            if payload is not None}
+
+
+def write_generated_payloads(cache_key):
+    """
+    Writes the reminders sent in this run, exactly as they went over the
+    wire, to GENERATED_SEND_PATH so the next run with the same tenants can
+    skip building the messages. Groups with non-ASCII addresses were sent
+    with send_message() for SMTPUTF8 handling and are stored as None.
+    """
+    with sent_payloads_lock:
+        payloads = [sent_payloads.get(group) for group in REMINDER_GROUPS]
+    if not any(payloads):
+        return
+
+    lines = [
+        "# Generated by send_email_reminders.py; do not edit.",
+        "{",
+        f"    'cache_key': {cache_key!r},",
+        "    'payloads': (",
+    ]
+    for group, payload in zip(REMINDER_GROUPS, payloads):
+        lines.append(
+            f"        # {', '.join(member.email for member in group)}")
+        lines.append(f"        {payload!r},")
+    lines.append("    ),")
+    lines.append("}")
+
+    temp_path = f"{GENERATED_SEND_PATH}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as generated_file:
+            generated_file.write("\n".join(lines) + "\n")
+        os.replace(temp_path, GENERATED_SEND_PATH)
+        logging.info(f"Saved pre-serialized reminders to {GENERATED_SEND_PATH}.")
+    except OSError as e:
+        logging.warning(f"Could not save pre-serialized reminders: {e}")
+
+
+# Reminders pre-serialized by an earlier successful run with these tenants
+REMINDER_CACHE_KEY = reminder_cache_key()
+GENERATED_PAYLOADS = load_generated_payloads(REMINDER_CACHE_KEY)
+
+# Serialized reminders sent in this run, kept for write_generated_payloads()
+sent_payloads = {}
+sent_payloads_lock = threading.Lock()
+
+
+def send_email_reminder(group, server) -> List[Result]:
+    """
+    Sends one rent payment reminder to a group of tenants from
+    REMINDER_GROUPS over an already-connected SMTP session, as a single
+    transaction with one RCPT TO per tenant. A message for several tenants
+    gets an undisclosed-recipients To: header, so no tenant sees another's
+    address. Shares no mutable state with other workers; a Result per
+    tenant is returned.
+    """
+    addrs = [member.email for member in group]
+    try:
+        # Reuse the pre-serialized message from a previous run if there is
+        # one. Otherwise build it, and serialize it here when the addresses
+        # are ASCII, so the sent bytes can be saved for the next run
+        msg = GENERATED_PAYLOADS.get(group)
+        if msg is None:
+            msg = build_reminder_message(group)
+            if all(addr.isascii() for addr in addrs):
+                msg = msg.as_bytes()
+
+        # Send the email over the shared session
         try:
-            with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-                server.starttls()
-                server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-                server.sendmail(
-                    EMAIL_ADDRESS, tenant["email"], msg.as_string())
-            logging.info(f"Reminder email sent successfully to {
-                         tenant['name']} ({tenant['email']}).")
-            success_count += 1
+            refused = send_with_reconnect(server, addrs, msg)
         except smtplib.SMTPException as smtp_err:
             logging.error(f"SMTP error when sending email to {
-                          tenant.get('email', 'Unknown')}: {smtp_err}")
-            failure_count += 1
-            failed_tenants.append({
-                "tenant": tenant.get("name", "Unknown"),
-                "email": tenant.get("email", "Unknown"),
-                "reason": f"SMTP error: {smtp_err}"
-            })
+                          ', '.join(addrs)}: {smtp_err}")
+            return [Result(False, member.name, member.email,
+                           f"SMTP error: {smtp_err}") for member in group]
+        if isinstance(msg, bytes):
+            with sent_payloads_lock:
+                sent_payloads[group] = msg
+
+        results = []
+        for member in group:
+            if member.email in refused:
+                logging.error(f"SMTP error when sending email to {
+                              member.email}: {refused[member.email]}")
+                results.append(Result(
+                    False, member.name, member.email,
+                    f"SMTP error: recipient refused {refused[member.email]}"))
+            else:
+                logging.info(f"Reminder email sent successfully to {
+                             member.name} ({member.email}).")
+                results.append(Result(True, member.name, member.email, None))
+        return results
 
     except Exception as e:
         logging.error(f"Unexpected error when sending email to {
-                      tenant.get('email', 'Unknown')}: {e}")
-        failure_count += 1
-        failed_tenants.append({
-            "tenant": tenant.get("name", "Unknown"),
-            "email": tenant.get("email", "Unknown"),
-            "reason": f"Unexpected error: {e}"
-        })
+                      ', '.join(addrs)}: {e}")
+        return [Result(False, member.name, member.email,
+                       f"Unexpected error: {e}") for member in group]
+
+
+def build_log_attachment(path):
+    """
+    Builds the gzip-compressed MIME attachment for the log file. The file
+    is streamed through the compressor in chunks, so only the much smaller
+    compressed copy is ever held in memory.
+    """
+    filename = f"{os.path.basename(path)}.gz"
+    compressed = io.BytesIO()
+    with open(path, "rb") as log_file, gzip.GzipFile(
+            filename=os.path.basename(path), mode="wb",
+            compresslevel=6, fileobj=compressed) as gzip_file:
+        shutil.copyfileobj(log_file, gzip_file, LOG_ATTACHMENT_CHUNK_SIZE)
+
+    part = MIMEApplication(compressed.getvalue(), "gzip", Name=filename)
+    part["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return part
 
 
-def send_log_email():
+def send_log_email(server):
     """
     Sends the log file as an attachment to the landlord.
     """
@@ -230,29 +879,25 @@ Your Automated Email System
 
         msg = MIMEMultipart()
         msg["Subject"] = subject
-        msg["From"] = EMAIL_ADDRESS
-        msg["To"] = LANDLORD_EMAIL
+        msg["From"] = CONFIG.email_address
+        msg["To"] = CONFIG.landlord_email
 
         # Attach the body text
         msg.attach(MIMEText(body, "plain"))
 
+        # Write out queued and buffered log records so the attachment is
+        # complete
+        flush_logs()
+
         # Attach the log file if it exists
         if os.path.isfile(log_file_path):
-            with open(log_file_path, "rb") as log_file:
-                part = MIMEApplication(
-                    log_file.read(), Name=os.path.basename(log_file_path))
-                part['Content-Disposition'] = f'attachment; filename="{
-                    os.path.basename(log_file_path)}"'
-                msg.attach(part)
+            msg.attach(build_log_attachment(log_file_path))
         else:
             logging.error(f"Log file not found at {
                           log_file_path}. Cannot attach to log email.")
 
         # Send the log email
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-            server.sendmail(EMAIL_ADDRESS, LANDLORD_EMAIL, msg.as_string())
+        send_with_reconnect(server, [CONFIG.landlord_email], msg)
 
         logging.info("Log email sent successfully to the landlord.")
 
@@ -262,24 +907,113 @@ Your Automated Email System
         logging.error(f"Unexpected error when sending log email: {e}")
 
 
+def send_reminder_in_worker(group) -> List[Result]:
+    """
+    Sends a single group's reminder using the calling worker thread's SMTP
+    session.
+    """
+    try:
+        server = get_thread_session()
+    except (smtplib.SMTPException, OSError) as smtp_err:
+        logging.error(f"Could not open SMTP connection for {
+                      ', '.join(member.email for member in group)}: {
+                      smtp_err}")
+        return [Result(False, member.name, member.email,
+                       f"SMTP connection error: {smtp_err}")
+                for member in group]
+    except Exception as e:
+        logging.error(f"Unexpected error when connecting for {
+                      ', '.join(member.email for member in group)}: {e}")
+        return [Result(False, member.name, member.email,
+                       f"Unexpected error: {e}")
+                for member in group]
+    return send_email_reminder(group, server)
+
+
 def send_emails_to_all_tenants():
     """
-    Sends reminder emails to all tenants.
+    Sends reminder emails to all tenants, in parallel over a bounded pool of
+    SMTP sessions. Returns a Result for every tenant, including the ones
+    rejected at startup.
     """
-    if not TENANTS:
+    results = [Result(False, tenant.name, tenant.email, tenant.error)
+               for tenant in INVALID_TENANTS]
+    if not VALID_TENANTS:
         logging.warning("No tenants found to send emails.")
-        return
-
-    for tenant in TENANTS:
-        send_email_reminder(tenant)
+        return results
+
+    # Give up early if the SMTP server is clearly failing, instead of paying
+    # a connect or socket timeout for every remaining tenant
+    abort_threshold = max(ABORT_MIN_FAILURES,
+                          len(VALID_TENANTS) // ABORT_FAILURE_FRACTION)
+    send_failures = 0
+
+    with ThreadPoolExecutor(max_workers=CONFIG.max_workers,
+                            thread_name_prefix="smtp-worker") as executor:
+        futures = {executor.submit(send_reminder_in_worker, group): group
+                   for group in REMINDER_GROUPS}
+        pending = set(futures)
+        for future in as_completed(futures):
+            pending.discard(future)
+            group_results = future.result()
+            results.extend(group_results)
+            send_failures += sum(
+                not result.success for result in group_results)
+            if send_failures >= abort_threshold:
+                logging.critical(
+                    f"Aborting after {send_failures} failed reminders; "
+                    "skipping every tenant not yet started.")
+                break
+
+        # Cancel everything that has not started before waiting on the sends
+        # already running, so idle workers cannot pick up more tenants
+        cancelled = {future for future in pending if future.cancel()}
+        for future in pending:
+            if future in cancelled:
+                results.extend(Result(
+                    False, member.name, member.email,
+                    "Skipped: sending aborted after too many failures")
+                    for member in futures[future])
+            else:
+                results.extend(future.result())
+    return results
 
 
 def check_and_send_email():
     """
     Executes the entire email sending process: reminders and logs.
     """
-    send_emails_to_all_tenants()
-    send_log_email()
+    try:
+        results = send_emails_to_all_tenants()
+        success_count = sum(result.success for result in results)
+        failed_tenants = [{
+            "tenant": result.tenant_name,
+            "email": result.email,
+            "reason": result.reason
+        } for result in results if not result.success]
+        logging.info(f"Reminders sent: {success_count}, failed: {
+                     len(failed_tenants)}.")
+        for failed in failed_tenants:
+            logging.info(f"Failed reminder: {failed}")
+
+        # Pre-serialize the reminders for the next run once every tenant in
+        # this list has been reached
+        if not GENERATED_PAYLOADS and VALID_TENANTS \
+                and success_count == len(VALID_TENANTS):
+            write_generated_payloads(REMINDER_CACHE_KEY)
+
+        try:
+            server = get_thread_session()
+        except (smtplib.SMTPException, OSError) as smtp_err:
+            logging.error(
+                f"Could not open SMTP connection for log email: {smtp_err}")
+        except Exception as e:
+            logging.error(
+                f"Unexpected error when connecting for log email: {e}")
+        else:
+            send_log_email(server)
+    finally:
+        close_all_sessions()
 
 
 if __name__ == "__main__":
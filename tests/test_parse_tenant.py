@@ -0,0 +1,75 @@
+import os
+import sys
+import unittest
+
+# The script reads its settings at import time
+os.environ.update(
+    SMTP_SERVER="127.0.0.1",
+    SMTP_PORT="25",
+    EMAIL_ADDRESS="landlord@example.com",
+    EMAIL_PASSWORD="password",
+    LANDLORD_EMAIL="landlord@example.com",
+    TENANTS="[]",
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from send_email_reminders import parse_tenant  # noqa: E402
+
+
+def tenant_entry(**fields):
+    entry = {
+        "email": "jane@example.com",
+        "name": "Jane",
+        "payment_amount": "1200",
+        "payment_description": "October rent",
+    }
+    entry.update(fields)
+    return entry
+
+
+class ParseTenantTest(unittest.TestCase):
+
+    def test_valid_entry(self):
+        tenant = parse_tenant(tenant_entry(property_location="Unit 4"))
+        self.assertIsNone(tenant.error)
+        self.assertEqual(tenant.name, "Jane")
+        self.assertEqual(tenant.payment_amount, 1200.0)
+        self.assertEqual(tenant.property_location, "Unit 4")
+        self.assertEqual(str(tenant.to_header), "jane@example.com")
+
+    def test_property_location_defaults(self):
+        self.assertEqual(parse_tenant(tenant_entry()).property_location, "N/A")
+
+    def test_non_ascii_address_is_accepted(self):
+        tenant = parse_tenant(tenant_entry(email="josé@example.com"))
+        self.assertIsNone(tenant.error)
+
+    def test_missing_fields(self):
+        tenant = parse_tenant({"email": "jane@example.com", "name": "Jane"})
+        self.assertEqual(
+            tenant.error, "Missing fields: payment_amount, payment_description")
+
+    def test_invalid_payment_amount(self):
+        tenant = parse_tenant(tenant_entry(payment_amount="lots"))
+        self.assertEqual(tenant.error, "Invalid payment_amount: lots")
+
+    def test_not_an_object(self):
+        tenant = parse_tenant(["jane@example.com"])
+        self.assertTrue(tenant.error.startswith("Tenant entry is not a JSON"))
+
+    def test_unparsable_addresses(self):
+        for addr in ("john@", "john@[1.2.3.4"):
+            with self.subTest(addr=addr):
+                tenant = parse_tenant(tenant_entry(email=addr))
+                self.assertEqual(tenant.error, f"Invalid email: {addr}")
+                self.assertIsNone(tenant.to_header)
+
+    def test_address_with_line_break(self):
+        for addr in ("a@b.com\r\nBcc: x@y", "a@b.com\nBcc: x@y"):
+            with self.subTest(addr=addr):
+                tenant = parse_tenant(tenant_entry(email=addr))
+                self.assertEqual(tenant.error, f"Invalid email: {addr}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+import os
+import sys
+import smtplib
+import socketserver
+import threading
+import unittest
+
+# The script reads its settings at import time
+os.environ.update(
+    SMTP_SERVER="127.0.0.1",
+    SMTP_PORT="25",
+    EMAIL_ADDRESS="landlord@example.com",
+    EMAIL_PASSWORD="password",
+    LANDLORD_EMAIL="landlord@example.com",
+    TENANTS="[]",
+)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import send_email_reminders  # noqa: E402
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    """
+    Speaks just enough SMTP for PipeliningSMTP.sendmail(). Replies are
+    written one per command line, so pipelined commands are answered in
+    order, exactly as a real server would.
+    """
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        server = self.server
+        recipients = []
+        self.reply("220 fake.example.com ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii").rstrip("\r\n")
+            verb = command.split(" ", 1)[0].upper()
+            server.commands.append(verb)
+
+            if verb == "EHLO":
+                if server.pipelining:
+                    self.reply("250-fake.example.com")
+                    self.reply("250-PIPELINING")
+                else:
+                    self.reply("250-fake.example.com")
+                self.reply("250 SIZE 1000000")
+            elif verb == "MAIL":
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                addr = command.split(":", 1)[1].strip("<>")
+                if addr in server.refused:
+                    self.reply("550 No such user")
+                else:
+                    recipients.append(addr)
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                if server.data_code != 354 or not recipients:
+                    self.reply(f"{server.data_code if recipients else 554} "
+                               "Transaction failed")
+                    continue
+                self.reply("354 Go ahead")
+                data = b""
+                while True:
+                    data_line = self.rfile.readline()
+                    if data_line in (b".\r\n", b""):
+                        break
+                    data += data_line
+                server.messages.append((recipients, data))
+                if server.end_of_data_code == 421:
+                    self.reply("421 Closing connection")
+                    return
+                self.reply(f"{server.end_of_data_code} Done")
+            elif verb == "RSET":
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Not implemented")
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, pipelining=True, refused=(), data_code=354,
+                 end_of_data_code=250):
+        super().__init__(("127.0.0.1", 0), FakeSMTPHandler)
+        self.pipelining = pipelining
+        self.refused = set(refused)
+        self.data_code = data_code
+        self.end_of_data_code = end_of_data_code
+        self.commands = []
+        self.messages = []
+
+
+MESSAGE = b"Subject: Reminder\r\n\r\nRent is due.\r\n.leading dot\r\n"
+
+
+class PipeliningSMTPTest(unittest.TestCase):
+
+    def start_server(self, **options):
+        server = FakeSMTPServer(**options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        client = send_email_reminders.PipeliningSMTP(local_hostname="test")
+        client.connect(*server.server_address)
+        self.addCleanup(client.close)
+        return server, client
+
+    def test_delivers_with_dot_stuffing(self):
+        server, client = self.start_server()
+        refused = client.sendmail("from@example.com",
+                                  ["a@example.com", "b@example.com"], MESSAGE)
+        self.assertEqual(refused, {})
+        self.assertEqual(server.commands,
+                         ["EHLO", "MAIL", "RCPT", "RCPT", "DATA"])
+        recipients, data = server.messages[0]
+        self.assertEqual(recipients, ["a@example.com", "b@example.com"])
+        self.assertIn(b"\r\n..leading dot\r\n", data)
+
+    def test_one_recipient_refused(self):
+        server, client = self.start_server(refused=["b@example.com"])
+        refused = client.sendmail(
+            "from@example.com",
+            ["a@example.com", "b@example.com", "c@example.com"], MESSAGE)
+        self.assertEqual(list(refused), ["b@example.com"])
+        self.assertEqual(refused["b@example.com"][0], 550)
+        self.assertEqual(server.messages[0][0],
+                         ["a@example.com", "c@example.com"])
+
+    def test_all_recipients_refused(self):
+        server, client = self.start_server(
+            refused=["a@example.com", "b@example.com"])
+        with self.assertRaises(smtplib.SMTPRecipientsRefused) as caught:
+            client.sendmail("from@example.com",
+                            ["a@example.com", "b@example.com"], MESSAGE)
+        self.assertEqual(set(caught.exception.recipients),
+                         {"a@example.com", "b@example.com"})
+        self.assertEqual(server.commands[-1], "RSET")
+        self.assertEqual(server.messages, [])
+
+        # The session was reset and can carry the next message
+        server.refused.clear()
+        client.sendmail("from@example.com", ["a@example.com"], MESSAGE)
+        self.assertEqual(len(server.messages), 1)
+
+    def test_data_rejected(self):
+        server, client = self.start_server(data_code=554)
+        with self.assertRaises(smtplib.SMTPDataError) as caught:
+            client.sendmail("from@example.com", ["a@example.com"], MESSAGE)
+        self.assertEqual(caught.exception.smtp_code, 554)
+        self.assertEqual(server.commands[-1], "RSET")
+        self.assertEqual(server.messages, [])
+
+    def test_message_rejected_after_data(self):
+        server, client = self.start_server(end_of_data_code=550)
+        with self.assertRaises(smtplib.SMTPDataError) as caught:
+            client.sendmail("from@example.com", ["a@example.com"], MESSAGE)
+        self.assertEqual(caught.exception.smtp_code, 550)
+        self.assertEqual(server.commands[-1], "RSET")
+
+    def test_server_closing_after_data(self):
+        server, client = self.start_server(end_of_data_code=421)
+        with self.assertRaises(smtplib.SMTPDataError) as caught:
+            client.sendmail("from@example.com", ["a@example.com"], MESSAGE)
+        self.assertEqual(caught.exception.smtp_code, 421)
+        self.assertIsNone(client.sock)
+
+    def test_server_without_pipelining(self):
+        server, client = self.start_server(pipelining=False,
+                                           refused=["b@example.com"])
+        refused = client.sendmail("from@example.com",
+                                  ["a@example.com", "b@example.com"], MESSAGE)
+        self.assertEqual(list(refused), ["b@example.com"])
+        recipients, data = server.messages[0]
+        self.assertEqual(recipients, ["a@example.com"])
+        self.assertIn(b"\r\n..leading dot\r\n", data)
+
+
+if __name__ == "__main__":
+    unittest.main()